@@ -1,12 +1,114 @@
 import argparse
+import importlib
 import json
+import mmap
 import os
 import shutil
 import sys
 import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MODULE_NAME = "rust_audio_resampler"
+NATIVE_SUFFIXES = (".so", ".pyd", ".dylib")
+if sys.platform.startswith("win"):
+    PREFERRED_TAGS = ("win_amd64", "win32")
+elif sys.platform == "darwin":
+    PREFERRED_TAGS = ("macosx_11_0_arm64", "macosx_10_9_x86_64", "macosx")
+else:
+    PREFERRED_TAGS = ("manylinux", "linux")
+WHEEL_CACHE_PATH = Path.home() / ".cache" / "vmusic" / "wheel_probe.json"
+WHEEL_CACHE_KEY = f"{sys.platform}-{sys.version_info[0]}.{sys.version_info[1]}"
+EXTRACT_BUFFER_SIZE = 1 << 20
+EXTRACT_OPEN_FLAGS = (
+    os.O_WRONLY
+    | os.O_CREAT
+    | os.O_TRUNC
+    | getattr(os, "O_BINARY", 0)
+    | getattr(os, "O_SEQUENTIAL", 0)
+)
+# The engine calls the wheel with float64 (python/main.py), so that is the
+# contract each smoke test checks; other dtypes are only reported for reference.
+CONTRACT_DTYPE = "float64"
+EXTRA_DTYPES = ("float32",)
+_EXPORTS_CACHE = {}
+
+
+def cached_import(name):
+    modules = sys.modules
+    if name not in modules:
+        importlib.import_module(name)
+    return modules[name]
+
+
+def load_wheel_cache():
+    try:
+        data = json.loads(WHEEL_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def stat_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def scanned_folders(candidates, path):
+    # Candidates searched up to and including the wheel's folder; adding a
+    # wheel to any of them changes its mtime and invalidates the entry.
+    index = candidates.index(path.parent)
+    return candidates[: index + 1]
+
+
+def read_cached_wheel(candidates):
+    entry = load_wheel_cache().get(WHEEL_CACHE_KEY)
+    if not isinstance(entry, dict):
+        return None
+    path = entry.get("path")
+    mtime = entry.get("mtime")
+    folders = entry.get("folders")
+    if not isinstance(path, str) or not isinstance(folders, dict):
+        return None
+    if isinstance(mtime, bool) or not isinstance(mtime, (int, float)):
+        return None
+    path = Path(path)
+    if path.parent not in candidates:
+        return None
+    if stat_mtime(path) != mtime:
+        return None
+    for folder in scanned_folders(candidates, path):
+        key = str(folder)
+        if key not in folders or stat_mtime(folder) != folders[key]:
+            return None
+    return path
+
+
+def write_cached_wheel(path, candidates):
+    data = load_wheel_cache()
+    try:
+        data[WHEEL_CACHE_KEY] = {
+            "path": str(path),
+            "mtime": os.stat(path).st_mtime,
+            "folders": {
+                str(folder): stat_mtime(folder)
+                for folder in scanned_folders(candidates, path)
+            },
+        }
+        WHEEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        WHEEL_CACHE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+
 
 def locate_wheel(explicit_path):
     if explicit_path:
@@ -29,113 +131,294 @@ def locate_wheel(explicit_path):
         Path.cwd(),
         script_root.parent / "VCPChat" / "audio_engine",
     ]
-    def pick_wheel(matches):
-        if not matches:
-            return None
-        platform = sys.platform
-        preferred_tags = []
-        if platform.startswith("win"):
-            preferred_tags = ["win_amd64", "win32"]
-        elif platform == "darwin":
-            preferred_tags = ["macosx_11_0_arm64", "macosx_10_9_x86_64", "macosx"]
-        else:
-            preferred_tags = ["manylinux", "linux"]
-
-        for tag in preferred_tags:
-            for match in matches:
-                if tag in match.name:
-                    return match
-        return matches[0]
+    cached = read_cached_wheel(candidates)
+    if cached:
+        return cached
 
     for folder in candidates:
-        if not folder.exists():
+        best_idx = len(PREFERRED_TAGS)
+        best_name = None
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    name = entry.name
+                    if not (name.startswith("rust_audio_resampler-") and name.endswith(".whl")):
+                        continue
+                    idx = next(
+                        (i for i, tag in enumerate(PREFERRED_TAGS) if tag in name),
+                        len(PREFERRED_TAGS),
+                    )
+                    if best_name is None or idx < best_idx:
+                        best_idx = idx
+                        best_name = name
+        except OSError:
             continue
-        matches = list(folder.glob("rust_audio_resampler-*.whl"))
-        picked = pick_wheel(matches)
-        if picked:
+        if best_name:
+            picked = folder / best_name
+            write_cached_wheel(picked, candidates)
             return picked
 
     return None
 
 
-def extract_wheel(wheel_path, extract_dir, keep):
+def default_extract_root():
+    # Extracted files are removed right after the probe, so keep them on tmpfs
+    # where available; other platforms keep tempfile's default location.
+    # Skip noexec mounts (Docker's default for /dev/shm): the extension could
+    # not be loaded from there.
+    if sys.platform.startswith("linux"):
+        if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+            try:
+                noexec = os.statvfs("/dev/shm").f_flag & os.ST_NOEXEC
+            except OSError:
+                return None
+            if not noexec:
+                return "/dev/shm"
+    return None
+
+
+def is_runtime_member(name):
+    return not (
+        name.endswith(".pyc") or name.endswith("RECORD") or "/tests/" in "/" + name
+    )
+
+
+def member_target(root, name):
+    # Reject members that would land outside root: absolute paths, drive
+    # letters and '..' components all normalise to somewhere else.
+    target = os.path.abspath(os.path.join(root, name))
+    try:
+        inside = os.path.commonpath([root, target]) == root
+    except ValueError:
+        inside = False
+    if not inside or target == root:
+        return None
+    return Path(target)
+
+
+class _WheelMap(mmap.mmap):
+    # zipfile's shared member reader queries seekable(), which mmap only
+    # grew in Python 3.13.
+    def seekable(self):
+        return True
+
+
+def map_wheel(wheel_path):
+    fd = os.open(wheel_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        mm = _WheelMap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    if hasattr(mm, "madvise"):
+        for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+            if hasattr(mmap, advice):
+                mm.madvise(getattr(mmap, advice))
+    return mm
+
+
+def extract_wheel(
+    wheel_path, extract_dir, keep, native_only=False, minimal=False, tmpfs=True
+):
     if extract_dir:
         out_dir = Path(extract_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
-        target_dir = out_dir
-    else:
-        target_dir = Path(tempfile.mkdtemp(prefix="vmusic_wheel_"))
+        return extract_members(wheel_path, out_dir, native_only, minimal)
 
-    with zipfile.ZipFile(wheel_path, "r") as zf:
-        zf.extractall(target_dir)
+    root = default_extract_root() if tmpfs else None
+    target_dir = Path(tempfile.mkdtemp(prefix="vmusic_wheel_", dir=root))
+    try:
+        return extract_members(wheel_path, target_dir, native_only, minimal)
+    except BaseException:
+        shutil.rmtree(target_dir, ignore_errors=True)
+        raise
+
+
+def extract_members(wheel_path, target_dir, native_only, minimal):
+    root = str(target_dir.resolve())
+    members = []
+    created_dirs = set()
+    with map_wheel(wheel_path) as mm, zipfile.ZipFile(mm, "r") as zf:
+        infos = zf.infolist()
+        if native_only:
+            # Native modules must sit next to their package's .py files on disk,
+            # so keep every member of a top-level package that ships one.
+            packages = {
+                zinfo.filename.split("/")[0]
+                for zinfo in infos
+                if zinfo.filename.endswith(NATIVE_SUFFIXES)
+            }
+            infos = [zinfo for zinfo in infos if zinfo.filename.split("/")[0] in packages]
+        if minimal:
+            infos = [zinfo for zinfo in infos if is_runtime_member(zinfo.filename)]
+        for zinfo in infos:
+            name = zinfo.filename
+            target = member_target(root, name)
+            if target is None:
+                continue
+            folder = target if name.endswith("/") else target.parent
+            if folder not in created_dirs:
+                folder.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(folder)
+            if not name.endswith("/"):
+                members.append((zinfo, target))
+
+    local = threading.local()
+    handles = []
+
+    def extract_one(member):
+        zinfo, target = member
+        if zinfo.file_size == 0:
+            os.close(os.open(target, EXTRACT_OPEN_FLAGS, 0o644))
+            return
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            mm = map_wheel(wheel_path)
+            zf = zipfile.ZipFile(mm, "r")
+            local.zf = zf
+            handles.append((zf, mm))
+        fd = os.open(target, EXTRACT_OPEN_FLAGS, 0o644)
+        try:
+            with zf.open(zinfo) as src:
+                while True:
+                    chunk = src.read(EXTRACT_BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    chunk = memoryview(chunk)
+                    while chunk:
+                        chunk = chunk[os.write(fd, chunk):]
+        finally:
+            os.close(fd)
+
+    if members:
+        workers = min(os.cpu_count() or 1, 8, len(members))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(extract_one, members))
+        finally:
+            for zf, mm in handles:
+                zf.close()
+                mm.close()
 
     return target_dir
 
 
+def discard_dir(path):
+    # Move the directory out of the way and delete it off the caller's path.
+    # The thread is non-daemon so the interpreter still finishes the delete
+    # before exiting instead of leaving a half-removed trash dir behind; the
+    # CLI therefore exits no sooner, only in-process callers get control back.
+    trash = path.with_name(f"{path.name}.trash-{os.getpid()}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+    ).start()
+
+
+def import_from_wheel(wheel_path, minimal=False):
+    wheel_entry = str(wheel_path)
+    sys.path.insert(0, wheel_entry)
+    try:
+        return None, cached_import(MODULE_NAME)
+    except ImportError:
+        sys.path.remove(wheel_entry)
+        with zipfile.ZipFile(wheel_path, "r") as zf:
+            has_native = any(name.endswith(NATIVE_SUFFIXES) for name in zf.namelist())
+        if not has_native:
+            raise
+
+    # tmpfs may be too small or mounted noexec in ways statvfs cannot tell
+    # (e.g. an LSM policy), so retry in the regular temp dir if it fails there.
+    attempts = (True, False) if default_extract_root() else (False,)
+    for tmpfs in attempts:
+        try:
+            work_dir = extract_wheel(
+                wheel_path, None, False, native_only=True, minimal=minimal, tmpfs=tmpfs
+            )
+        except OSError:
+            if tmpfs:
+                continue
+            raise
+        work_entry = str(work_dir)
+        sys.path.insert(0, work_entry)
+        try:
+            return work_dir, cached_import(MODULE_NAME)
+        except Exception:
+            sys.path.remove(work_entry)
+            shutil.rmtree(work_dir, ignore_errors=True)
+            if not tmpfs:
+                raise
+
+
 def try_import_numpy():
     try:
-        import numpy as np  # noqa: F401
+        np = cached_import("numpy")
     except Exception as exc:
         return None, str(exc)
     return np, None
 
 
 def collect_exports(module):
+    key = (module.__name__, id(module))
+    cached = _EXPORTS_CACHE.get(key)
+    if cached is not None:
+        return cached
     if hasattr(module, "__all__"):
-        return list(module.__all__)
-    return [name for name in dir(module) if not name.startswith("_")]
+        exports = list(module.__all__)
+    else:
+        exports = sorted(name for name in module.__dict__ if not name.startswith("_"))
+    _EXPORTS_CACHE[key] = exports
+    return exports
 
 
-def smoke_test_resample(module, np):
-    result = {"name": "resample", "status": "skipped"}
+def smoke_test_resample(module, np, scratch, dtype):
     if not hasattr(module, "resample"):
-        result["status"] = "missing"
-        return result
+        return {"name": "resample", "status": "missing"}
 
     frames = 2048
     channels = 2
     original_sr = 48000
     target_sr = 44100
-    signal = np.linspace(-1.0, 1.0, frames * channels, dtype=np.float64)
+    signal = scratch[dtype]["linspace_2048x2"]
 
     try:
         out = module.resample(signal, original_sr, target_sr, channels, quality="hq")
         if not hasattr(out, "__len__"):
-            result["status"] = "failed"
-            result["error"] = "output has no length"
-            return result
+            return {"name": "resample", "status": "failed", "error": "output has no length"}
 
         out_len = len(out)
         expected_frames = int(round(frames * (target_sr / original_sr)))
         expected_len = expected_frames * channels
         ratio = out_len / expected_len if expected_len else None
-        result["status"] = "passed"
-        result["details"] = {
+        details = {
             "input_len": int(len(signal)),
             "output_len": int(out_len),
             "expected_len": int(expected_len),
             "channels": channels,
             "ratio": ratio,
+            "dtype": dtype,
         }
         if expected_len and (out_len < expected_len * 0.5 or out_len > expected_len * 1.5):
-            result["status"] = "warning"
-            result["warning"] = "output length outside expected tolerance"
-        return result
+            return {
+                "name": "resample",
+                "status": "warning",
+                "details": details,
+                "warning": "output length outside expected tolerance",
+            }
+        return {"name": "resample", "status": "passed", "details": details}
     except Exception as exc:
-        result["status"] = "failed"
-        result["error"] = str(exc)
-        return result
+        return {"name": "resample", "status": "failed", "error": str(exc)}
 
 
-def smoke_test_volume_smoothing(module, np):
-    result = {"name": "apply_volume_smoothing", "status": "skipped"}
+def smoke_test_volume_smoothing(module, np, scratch, dtype):
     if not hasattr(module, "apply_volume_smoothing"):
-        result["status"] = "missing"
-        return result
+        return {"name": "apply_volume_smoothing", "status": "missing"}
 
-    frames = 64
     channels = 2
-    signal = np.ones(frames * channels, dtype=np.float64) * 0.5
+    signal = scratch[dtype]["ones_64x2"] * 0.5
     current = 0.0
     target = 1.0
 
@@ -143,106 +426,150 @@ def smoke_test_volume_smoothing(module, np):
         out, next_value = module.apply_volume_smoothing(
             signal, current, target, smoothing=0.5, channels=channels
         )
-        result["status"] = "passed"
-        result["details"] = {
-            "output_len": int(len(out)),
-            "next_value": float(next_value),
+        return {
+            "name": "apply_volume_smoothing",
+            "status": "passed",
+            "details": {
+                "output_len": int(len(out)),
+                "next_value": float(next_value),
+                "dtype": dtype,
+            },
         }
-        return result
     except Exception as exc:
-        result["status"] = "failed"
-        result["error"] = str(exc)
-        return result
+        return {"name": "apply_volume_smoothing", "status": "failed", "error": str(exc)}
 
 
-def smoke_test_iir_sos(module, np):
-    result = {"name": "apply_iir_sos", "status": "skipped"}
+def smoke_test_iir_sos(module, np, scratch, dtype):
     if not hasattr(module, "apply_iir_sos"):
-        result["status"] = "missing"
-        return result
+        return {"name": "apply_iir_sos", "status": "missing"}
 
-    frames = 64
     channels = 2
-    signal = np.linspace(-0.5, 0.5, frames * channels, dtype=np.float64)
-    sos = np.array([[1.0, 0.0, 0.0, 1.0, 0.0, 0.0]], dtype=np.float64)
-    flat_zi = np.zeros(channels * sos.shape[0] * 2, dtype=np.float64)
+    signal = scratch[dtype]["linspace_64x2"]
+    sos = np.array([[1.0, 0.0, 0.0, 1.0, 0.0, 0.0]], dtype=dtype)
+    flat_zi = np.zeros(channels * sos.shape[0] * 2, dtype=dtype)
+    atol = 1e-6 if dtype == "float32" else 1e-9
 
     try:
         out, next_zi = module.apply_iir_sos(signal, sos.flatten(), flat_zi, channels=channels)
-        result["status"] = "passed"
-        result["details"] = {
+        details = {
             "output_len": int(len(out)),
             "zi_len": int(len(next_zi)),
+            "dtype": dtype,
         }
-        if not np.allclose(out, signal, atol=1e-9):
-            result["status"] = "warning"
-            result["warning"] = "identity SOS output deviates from input"
-        return result
+        if not np.allclose(out, signal, atol=atol):
+            return {
+                "name": "apply_iir_sos",
+                "status": "warning",
+                "details": details,
+                "warning": "identity SOS output deviates from input",
+            }
+        return {"name": "apply_iir_sos", "status": "passed", "details": details}
     except Exception as exc:
-        result["status"] = "failed"
-        result["error"] = str(exc)
-        return result
+        return {"name": "apply_iir_sos", "status": "failed", "error": str(exc)}
 
 
-def smoke_test_noise_shaping(module, np):
-    result = {"name": "apply_noise_shaping_high_order", "status": "skipped"}
+def smoke_test_noise_shaping(module, np, scratch, dtype):
     if not hasattr(module, "apply_noise_shaping_high_order"):
-        result["status"] = "missing"
-        return result
+        return {"name": "apply_noise_shaping_high_order", "status": "missing"}
 
-    frames = 64
     channels = 2
-    signal = np.zeros(frames * channels, dtype=np.float64)
-    state = np.zeros(channels * 5, dtype=np.float64)
+    signal = scratch[dtype]["zeros_64x2"].copy()
+    state = np.zeros(channels * 5, dtype=dtype)
 
     try:
         out, next_state = module.apply_noise_shaping_high_order(
             signal, state, sample_rate=48000, bits=24, channels=channels
         )
-        result["status"] = "passed"
-        result["details"] = {
-            "output_len": int(len(out)),
-            "state_len": int(len(next_state)),
+        return {
+            "name": "apply_noise_shaping_high_order",
+            "status": "passed",
+            "details": {
+                "output_len": int(len(out)),
+                "state_len": int(len(next_state)),
+                "dtype": dtype,
+            },
         }
-        return result
     except Exception as exc:
-        result["status"] = "failed"
-        result["error"] = str(exc)
-        return result
+        return {"name": "apply_noise_shaping_high_order", "status": "failed", "error": str(exc)}
 
 
-def smoke_test_fft_convolver(module, np):
-    result = {"name": "FFTConvolver", "status": "skipped"}
+def smoke_test_fft_convolver(module, np, scratch, dtype):
     if not hasattr(module, "FFTConvolver"):
-        result["status"] = "missing"
-        return result
+        return {"name": "FFTConvolver", "status": "missing"}
 
-    frames = 128
     channels = 2
-    signal = np.linspace(-0.25, 0.25, frames * channels, dtype=np.float64)
-    ir = np.array([1.0], dtype=np.float64)
+    signal = scratch[dtype]["linspace_128x2"]
+    ir = np.array([1.0], dtype=dtype)
     full_ir = np.tile(ir[:, np.newaxis], (1, channels)).flatten()
 
     try:
         convolver = module.FFTConvolver(full_ir, channels)
         out = convolver.process(signal)
-        result["status"] = "passed"
-        result["details"] = {"output_len": int(len(out))}
-        return result
+        return {
+            "name": "FFTConvolver",
+            "status": "passed",
+            "details": {"output_len": int(len(out)), "dtype": dtype},
+        }
     except Exception as exc:
-        result["status"] = "failed"
-        result["error"] = str(exc)
+        return {"name": "FFTConvolver", "status": "failed", "error": str(exc)}
+
+
+def build_scratch(np, dtype):
+    # Shared input buffers; tests that may mutate their input take a copy.
+    return {
+        "linspace_2048x2": np.linspace(-1.0, 1.0, 2048 * 2, dtype=dtype),
+        "linspace_128x2": np.linspace(-0.25, 0.25, 128 * 2, dtype=dtype),
+        "linspace_64x2": np.linspace(-0.5, 0.5, 64 * 2, dtype=dtype),
+        "ones_64x2": np.ones(64 * 2, dtype=dtype),
+        "zeros_64x2": np.zeros(64 * 2, dtype=dtype),
+    }
+
+
+def run_smoke_test(test, module, np, scratch):
+    result = test(module, np, scratch, CONTRACT_DTYPE)
+    if result["status"] == "missing":
         return result
+    result["dtype_support"] = {
+        dtype: test(module, np, scratch, dtype)["status"] for dtype in EXTRA_DTYPES
+    }
+    return result
 
 
-def run_smoke_tests(module, np):
-    return [
-        smoke_test_resample(module, np),
-        smoke_test_noise_shaping(module, np),
-        smoke_test_iir_sos(module, np),
-        smoke_test_volume_smoothing(module, np),
-        smoke_test_fft_convolver(module, np),
+def run_smoke_tests(module, np, sequential=False):
+    scratch = {
+        dtype: build_scratch(np, dtype) for dtype in (CONTRACT_DTYPE,) + EXTRA_DTYPES
+    }
+    tests = [
+        smoke_test_resample,
+        smoke_test_noise_shaping,
+        smoke_test_iir_sos,
+        smoke_test_volume_smoothing,
+        smoke_test_fft_convolver,
     ]
+    if sequential:
+        return [run_smoke_test(test, module, np, scratch) for test in tests]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(run_smoke_test, test, module, np, scratch) for test in tests]
+        return [future.result() for future in futures]
+
+
+def emit_report(report, json_path):
+    if orjson is None:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        if json_path:
+            with open(json_path, "w", encoding="utf-8", buffering=65536) as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        return
+
+    data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    # Go through the text layer like the json fallback, so stdout keeps the
+    # same encoding whether or not orjson is installed.
+    sys.stdout.write(data.decode("utf-8"))
+    sys.stdout.write("\n")
+    if json_path:
+        with open(json_path, "wb") as f:
+            f.write(data)
 
 
 def parse_args():
@@ -250,7 +577,17 @@ def parse_args():
     parser.add_argument("--wheel", help="wheel path for rust_audio_resampler")
     parser.add_argument("--extract-dir", help="optional extract directory")
     parser.add_argument("--keep", action="store_true", help="keep extracted files")
+    parser.add_argument(
+        "--minimal",
+        action="store_true",
+        help="skip RECORD, *.pyc and tests/ members when extracting",
+    )
     parser.add_argument("--no-tests", action="store_true", help="skip smoke tests")
+    parser.add_argument(
+        "--sequential-tests",
+        action="store_true",
+        help="run smoke tests one after another instead of in a thread pool",
+    )
     parser.add_argument(
         "--require-numpy",
         action="store_true",
@@ -275,23 +612,30 @@ def main():
     if args.extract_dir:
         extract_dir = Path(args.extract_dir)
 
-    work_dir = extract_wheel(wheel_path, extract_dir, args.keep)
-    sys.path.insert(0, str(work_dir))
+    work_dir = None
+    if extract_dir or args.keep:
+        # Files kept with --keep must survive a reboot, so never use tmpfs here.
+        work_dir = extract_wheel(
+            wheel_path, extract_dir, args.keep, minimal=args.minimal, tmpfs=False
+        )
+        sys.path.insert(0, str(work_dir))
 
     report = {
         "wheel": str(wheel_path),
-        "extract_dir": str(work_dir),
+        "extract_dir": str(work_dir) if work_dir else None,
         "exports": [],
         "tests": [],
     }
 
     try:
-        import rust_audio_resampler as module
+        if work_dir:
+            module = cached_import(MODULE_NAME)
+        else:
+            work_dir, module = import_from_wheel(wheel_path, minimal=args.minimal)
+            report["extract_dir"] = str(work_dir) if work_dir else None
     except Exception as exc:
         report["error"] = f"import failed: {exc}"
-        print(json.dumps(report, ensure_ascii=False, indent=2))
-        if not args.keep and not args.extract_dir:
-            shutil.rmtree(work_dir, ignore_errors=True)
+        emit_report(report, None)
         return 3
 
     report["exports"] = collect_exports(module)
@@ -304,16 +648,12 @@ def main():
             else:
                 report["tests"] = [{"name": "numpy", "status": "skipped", "error": np_err}]
         else:
-            report["tests"] = run_smoke_tests(module, np)
-
-    output = json.dumps(report, ensure_ascii=False, indent=2)
-    print(output)
+            report["tests"] = run_smoke_tests(module, np, args.sequential_tests)
 
-    if args.json_path:
-        Path(args.json_path).write_text(output, encoding="utf-8")
+    emit_report(report, args.json_path)
 
-    if not args.keep and not args.extract_dir:
-        shutil.rmtree(work_dir, ignore_errors=True)
+    if work_dir and not args.keep and not args.extract_dir:
+        discard_dir(work_dir)
 
     return 0
 